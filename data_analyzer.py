@@ -1,32 +1,336 @@
 """
 Interactive Data Analyzer App
 A basic Python application for data analysts to load, clean, analyze, and visualize datasets.
+
+Optional dependencies: python-calamine (fast Excel reading; falls back to
+openpyxl), numba (compiled numeric summary; falls back to NumPy) and polars
+(CSV load/overview/statistics/cleaning when ANALYZER_BACKEND=polars).
 """
 
+from collections import Counter
+import io
+import numpy as np
+import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import sys
+import warnings
+
+# Rebound to numba.prange when the optional numba kernel is compiled
+prange = range
+
+# Optional alternative backend; only imported when ANALYZER_BACKEND=polars
+pl = None
+
+
+def _import_polars():
+    """Import polars into the module global pl; returns None when it isn't installed"""
+    global pl
+    if pl is None:
+        try:
+            import polars
+        except ImportError:
+            return None
+        pl = polars
+    return pl
+
+
+# Above these sizes the scatter panel is subsampled / replaced by a hexbin
+MAX_SCATTER_POINTS = 20_000
+HEXBIN_THRESHOLD = 200_000
+
+# Dashboard panels are rendered separately at this size and stitched 2x2
+PANEL_FIGSIZE = (7, 5)
+DASHBOARD_DPI = 300
+
+# String columns with at most this share of distinct values become 'category'
+CATEGORY_RATIO = 0.5
+
+# Reports are written through one large buffer instead of many small writes
+REPORT_BUFFER_SIZE = 1 << 20
+
+# With more categorical columns than this, statistics show one summary table
+WIDE_CATEGORICAL_COLUMNS = 10
+
+# Above this many distinct values, top values are picked without a full sort
+TOP_K_CARDINALITY = 10_000
+
+# CSVs larger than this are aggregated chunk by chunk instead of loaded
+STREAM_THRESHOLD_BYTES = 1 << 30
+STREAM_CHUNKSIZE = 100_000
+
+SUMMARY_FIELDS = ['count', 'mean', 'std', 'min', 'max', 'nan_count']
+
+
+def _col_summary_loops(arr):
+    """Single pass over a 2-D float array: per-column count/mean/std/min/max/nan_count"""
+    n_rows, n_cols = arr.shape
+    out = np.empty((n_cols, 6))
+    for j in prange(n_cols):
+        count = 0
+        nans = 0
+        mean = 0.0
+        m2 = 0.0
+        lo = np.inf
+        hi = -np.inf
+        for i in range(n_rows):
+            x = arr[i, j]
+            if np.isnan(x):
+                nans += 1
+                continue
+            # Welford's update keeps the variance numerically stable
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+        out[j, 0] = count
+        out[j, 1] = mean if count > 0 else np.nan
+        out[j, 2] = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+        out[j, 3] = lo if count > 0 else np.nan
+        out[j, 4] = hi if count > 0 else np.nan
+        out[j, 5] = nans
+    return out
+
+
+def _col_summary_numpy(arr):
+    """Vectorized fallback for _col_summary when numba isn't installed"""
+    nan_mask = np.isnan(arr)
+    nans = nan_mask.sum(axis=0)
+    count = arr.shape[0] - nans
+    out = np.full((arr.shape[1], 6), np.nan)
+    out[:, 0] = count
+    out[:, 5] = nans
+    has_values = count > 0
+    if has_values.any():
+        values = arr[:, has_values]
+        out[has_values, 1] = np.nanmean(values, axis=0)
+        out[has_values, 3] = np.nanmin(values, axis=0)
+        out[has_values, 4] = np.nanmax(values, axis=0)
+    has_spread = count > 1
+    if has_spread.any():
+        out[has_spread, 2] = np.nanstd(arr[:, has_spread], axis=0, ddof=1)
+    return out
+
+
+_col_summary_kernel = None
+
+
+def _col_summary(arr):
+    """Per-column summary of arr; numba is imported (and the kernel compiled) on first use"""
+    global _col_summary_kernel, prange
+    if _col_summary_kernel is None:
+        try:
+            # Optional, and slow to import, so only loaded once a summary is needed
+            import numba
+        except ImportError:
+            _col_summary_kernel = _col_summary_numpy
+        else:
+            prange = numba.prange
+            _col_summary_kernel = numba.njit(parallel=True, cache=True)(_col_summary_loops)
+    return _col_summary_kernel(arr)
+
+
+def _merge_summaries(total, part):
+    """Combine two _col_summary results for the same columns (Chan's parallel update)"""
+    if total is None:
+        return part
+    n_a, n_b = total[:, 0], part[:, 0]
+    n = n_a + n_b
+    mean_a, mean_b = np.nan_to_num(total[:, 1]), np.nan_to_num(part[:, 1])
+    m2_a = np.nan_to_num(total[:, 2] ** 2 * (n_a - 1))
+    m2_b = np.nan_to_num(part[:, 2] ** 2 * (n_b - 1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+        std = np.sqrt(m2 / (n - 1))
+    out = np.empty_like(total)
+    out[:, 0] = n
+    out[:, 1] = np.where(n > 0, mean, np.nan)
+    out[:, 2] = np.where(n > 1, std, np.nan)
+    out[:, 3] = np.fmin(total[:, 3], part[:, 3])
+    out[:, 4] = np.fmax(total[:, 4], part[:, 4])
+    out[:, 5] = total[:, 5] + part[:, 5]
+    return out
+
+
+def _pyplot():
+    """Import pyplot and seaborn on demand (they are slow to import)"""
+    # The dashboard is only ever saved to disk, so use the headless Agg backend
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    sns.set_style("whitegrid")
+    return plt, sns
+
+
+def _figure_pixels(plt, fig):
+    """Rasterize a figure to an RGBA array and close it"""
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+    return image
+
+
+def _render_panel(kind, payload):
+    """Draw one dashboard panel on its own figure and return its RGBA pixels"""
+    plt, sns = _pyplot()
+    fig, ax = plt.subplots(figsize=PANEL_FIGSIZE, dpi=DASHBOARD_DPI, constrained_layout=True)
+    
+    if kind == 'hist':
+        edges = payload['edges']
+        ax.bar(edges[:-1], payload['counts'], width=np.diff(edges), align='edge',
+               color='skyblue', edgecolor='black')
+        ax.set_title(f"Distribution of {payload['column']}")
+        ax.set_xlabel(payload['column'])
+        ax.set_ylabel('Frequency')
+    elif kind == 'bar':
+        positions = range(len(payload['counts']))
+        ax.bar(positions, payload['counts'], color='coral')
+        ax.set_title(f"Top Values in {payload['column']}")
+        ax.set_xticks(positions)
+        ax.set_xticklabels(payload['labels'], rotation=45, ha='right')
+        ax.set_ylabel('Count')
+    elif kind == 'heatmap':
+        sns.heatmap(payload['corr'], annot=True, fmt='.2f', cmap='coolwarm',
+                    xticklabels=payload['labels'], yticklabels=payload['labels'],
+                    ax=ax, cbar_kws={'label': 'Correlation'})
+        ax.set_title('Correlation Heatmap')
+    elif kind in ('scatter', 'hexbin'):
+        if kind == 'hexbin':
+            ax.hexbin(payload['x'], payload['y'], gridsize=50, cmap='Greens', mincnt=1)
+        else:
+            ax.scatter(payload['x'], payload['y'], alpha=0.5, color='green')
+        ax.set_title(f"{payload['xlabel']} vs {payload['ylabel']}")
+        ax.set_xlabel(payload['xlabel'])
+        ax.set_ylabel(payload['ylabel'])
+    
+    return _figure_pixels(plt, fig)
+
+
+def _render_title(title):
+    """Render the dashboard title as a strip as wide as two panels"""
+    plt, _ = _pyplot()
+    fig = plt.figure(figsize=(2 * PANEL_FIGSIZE[0], 0.6), dpi=DASHBOARD_DPI)
+    fig.text(0.5, 0.5, title, ha='center', va='center', fontsize=16, fontweight='bold')
+    return _figure_pixels(plt, fig)
+
 
 class DataAnalyzer:
     def __init__(self):
         self.df = None
         self.filename = None
-        sns.set_style("whitegrid")
-        
-    def load_data(self, filepath):
-        """Load CSV or Excel file"""
+        self._use_polars = (os.getenv('ANALYZER_BACKEND') == 'polars'
+                            and _import_polars() is not None)
+    
+    @property
+    def df(self):
+        if self._df is None and self._pldf is not None:
+            # Plotting and reports need pandas, so convert the Polars frame once
+            self._df = self._pldf.to_pandas(use_pyarrow_extension_array=True)
+        return self._df
+    
+    @df.setter
+    def df(self, value):
+        self._df = value
+        # A loaded frame replaces any streamed aggregates or Polars frame
+        self._agg = None
+        self._pldf = None
+        self._invalidate_cache()
+    
+    def _invalidate_cache(self):
+        """Drop column groups and missing counts derived from self.df"""
+        self._numeric_pos = None
+        self._categorical_pos = None
+        self._missing_counts = None
+        self._summary = None
+    
+    def _column_positions(self, include):
+        """Positions of the columns select_dtypes(include=include) would pick"""
+        # Positional labels on an empty slice keep duplicate column names unambiguous
+        probe = self.df.iloc[:0].set_axis(range(self.df.shape[1]), axis=1)
+        return probe.select_dtypes(include=include).columns.to_numpy(dtype=np.int64)
+    
+    def _numeric_idx(self):
+        """Numeric column positions, cached until self.df changes"""
+        if self._numeric_pos is None:
+            self._numeric_pos = self._column_positions(['number'])
+        return self._numeric_pos
+    
+    def _categorical_idx(self):
+        """Categorical/string column positions, cached until self.df changes"""
+        if self._categorical_pos is None:
+            self._categorical_pos = self._column_positions(['object', 'category', 'str'])
+        return self._categorical_pos
+    
+    def _numeric(self):
+        """Numeric column labels"""
+        return self.df.columns[self._numeric_idx()]
+    
+    def _categorical(self):
+        """Categorical/string column labels"""
+        return self.df.columns[self._categorical_idx()]
+    
+    def _missing(self):
+        """Per-column missing value counts, cached until self.df changes"""
+        if self._missing_counts is None:
+            self._missing_counts = self.df.isnull().sum()
+        return self._missing_counts
+    
+    def _numeric_block(self):
+        """Numeric columns as a 2-D float64 array with NaN for missing values"""
+        return self.df.iloc[:, self._numeric_idx()].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    def _prescan(self, block=None):
+        """Per-column numeric summary (see SUMMARY_FIELDS), cached until self.df changes.
+        
+        Pass the caller's _numeric_block() as block to avoid building it twice.
+        """
+        if self._summary is None:
+            numeric_cols = self._numeric()
+            if block is None:
+                block = self._numeric_block()
+            summary = _col_summary(block)
+            self._summary = pd.DataFrame(summary, index=numeric_cols, columns=SUMMARY_FIELDS)
+        return self._summary
+        
+    def load_data(self, filepath, use_arrow=True, stream_threshold=STREAM_THRESHOLD_BYTES):
+        """Load CSV or Excel file (Arrow-backed parsing unless use_arrow=False).
+        
+        The pyarrow engine parses ISO dates into date columns, so they are no
+        longer listed with the categorical (string) columns in the statistics.
+        CSVs larger than stream_threshold bytes are not kept in memory; only the
+        aggregates needed for the overview, statistics and report are collected.
+        """
         try:
             file_ext = Path(filepath).suffix.lower()
-            if file_ext == '.csv':
-                self.df = pd.read_csv(filepath)
+            if file_ext == '.csv' and os.path.getsize(filepath) > stream_threshold:
+                self._stream_csv(filepath)
+                self.filename = Path(filepath).name
+                print(f"✓ Streamed {self.filename} (too large to load into memory)")
+                print(f"  Shape: {self._agg['rows']} rows × {len(self._agg['dtypes'])} columns\n")
+                return True
+            elif file_ext == '.csv' and self._use_polars:
+                self.df = None
+                self._pldf = pl.read_csv(filepath, try_parse_dates=True)
+                self.filename = Path(filepath).name
+                print(f"✓ Successfully loaded {self.filename} (polars backend)")
+                print(f"  Shape: {self._pldf.height} rows × {self._pldf.width} columns\n")
+                return True
+            elif file_ext == '.csv':
+                self.df = self._read_csv(filepath, use_arrow)
             elif file_ext in ['.xlsx', '.xls']:
-                self.df = pd.read_excel(filepath)
+                self.df = self._read_excel(filepath)
             else:
                 print(f"Unsupported file type: {file_ext}")
                 return False
             
+            self._categorize_strings()
             self.filename = Path(filepath).name
             print(f"✓ Successfully loaded {self.filename}")
             print(f"  Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns\n")
@@ -35,16 +339,81 @@ class DataAnalyzer:
             print(f"Error loading file: {e}")
             return False
     
-    def create_sample_data(self):
+    def _read_csv(self, filepath, use_arrow=True):
+        """Read a CSV with the pyarrow engine, falling back to the default parser"""
+        if use_arrow:
+            try:
+                return pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
+            except (ImportError, ValueError):
+                # pyarrow missing or an option it doesn't support
+                pass
+        return pd.read_csv(filepath)
+    
+    def _stream_csv(self, filepath):
+        """Aggregate a CSV chunk by chunk into self._agg without keeping the rows"""
+        agg = None
+        for chunk in pd.read_csv(filepath, chunksize=STREAM_CHUNKSIZE):
+            if agg is None:
+                # Column groups and dtypes are taken from the first chunk
+                numeric_cols = chunk.select_dtypes(include=['number']).columns
+                categorical_cols = chunk.select_dtypes(include=['object', 'category', 'str']).columns
+                agg = {
+                    'rows': 0,
+                    'dtypes': chunk.dtypes,
+                    'head': chunk.head(),
+                    'missing': pd.Series(0, index=chunk.columns),
+                    'numeric_cols': numeric_cols,
+                    'summary': None,
+                    'value_counts': {col: Counter() for col in categorical_cols},
+                }
+            agg['rows'] += len(chunk)
+            agg['missing'] += chunk.isnull().sum()
+            block = chunk[numeric_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+            agg['summary'] = _merge_summaries(agg['summary'], _col_summary(block))
+            for col, counts in agg['value_counts'].items():
+                counts.update(chunk[col].value_counts().to_dict())
+        
+        self.df = None
+        self._agg = agg
+    
+    def _streamed_summary(self):
+        """Numeric summary table built from the streamed aggregates"""
+        summary = pd.DataFrame(self._agg['summary'], index=self._agg['numeric_cols'],
+                               columns=SUMMARY_FIELDS)
+        return summary[['count', 'mean', 'std', 'min', 'max']].T
+    
+    def _read_excel(self, filepath):
+        """Read an Excel file with calamine, falling back to pandas' default engine"""
+        try:
+            return pd.read_excel(filepath, engine='calamine')
+        except (ImportError, ValueError):
+            # python-calamine isn't installed, or pandas < 2.2 doesn't know the
+            # engine ("Unknown engine: calamine"). The default engine (openpyxl
+            # for .xlsx, already in read-only mode; xlrd for .xls) still works.
+            return pd.read_excel(filepath)
+    
+    def _categorize_strings(self):
+        """Store low-cardinality string columns as categories"""
+        string_idx = self._column_positions(['object', 'str'])
+        if len(string_idx) > 0:
+            distinct = self.df.iloc[:, string_idx].nunique(dropna=True).to_numpy()
+            # Entirely empty columns (e.g. null[pyarrow]) can't become categories
+            low_cardinality = (distinct > 0) & (distinct <= CATEGORY_RATIO * len(self.df))
+            for pos in string_idx[low_cardinality]:
+                self.df.isetitem(pos, self.df.iloc[:, pos].astype('category'))
+        
+        # Columns were replaced in place, so the setter didn't see it
+        self._invalidate_cache()
+    
+    def create_sample_data(self, n=100):
         """Create sample sales dataset for demonstration"""
-        import numpy as np
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         
-        dates = pd.date_range('2024-01-01', periods=100, freq='D')
-        regions = np.random.choice(['North', 'South', 'East', 'West'], 100)
-        products = np.random.choice(['Product A', 'Product B', 'Product C'], 100)
-        sales = np.random.randint(1000, 10000, 100)
-        units = np.random.randint(10, 100, 100)
+        dates = pd.date_range('2024-01-01', periods=n, freq='D')
+        regions = rng.choice(['North', 'South', 'East', 'West'], n)
+        products = rng.choice(['Product A', 'Product B', 'Product C'], n)
+        sales = rng.integers(1000, 10000, n)
+        units = rng.integers(10, 100, n)
         
         self.df = pd.DataFrame({
             'Date': dates,
@@ -52,33 +421,44 @@ class DataAnalyzer:
             'Product': products,
             'Sales': sales,
             'Units': units,
-            'Price': (sales / units).round(2)
+            'Price': np.round(sales / units, 2)
         })
+        self._categorize_strings()
         
         self.filename = "sample_sales_data.csv"
-        print("✓ Sample dataset created (100 rows × 6 columns)\n")
+        print(f"✓ Sample dataset created ({n} rows × 6 columns)\n")
         return True
     
     def show_overview(self):
         """Display dataset overview"""
-        if self.df is None:
+        if self._agg is not None:
+            rows, dtypes = self._agg['rows'], self._agg['dtypes']
+            head, missing = self._agg['head'], self._agg['missing']
+        elif self._pldf is not None:
+            rows = self._pldf.height
+            dtypes = pd.Series({name: str(dtype) for name, dtype in self._pldf.schema.items()})
+            head = self._pldf.head().to_pandas()
+            missing = self._pldf.null_count().to_pandas().iloc[0]
+        elif self.df is None:
             print("No data loaded. Please load a file first.")
             return
+        else:
+            rows, dtypes = self.df.shape[0], self.df.dtypes
+            head, missing = self.df.head(), self._missing()
         
         print("=" * 60)
         print("DATASET OVERVIEW")
         print("=" * 60)
         print(f"\nFile: {self.filename}")
-        print(f"Rows: {self.df.shape[0]} | Columns: {self.df.shape[1]}")
+        print(f"Rows: {rows} | Columns: {len(dtypes)}")
         
         print("\n--- Column Information ---")
-        print(self.df.dtypes.to_string())
+        print(dtypes.to_string())
         
         print("\n--- First 5 Rows ---")
-        print(self.df.head().to_string())
+        print(head.to_string())
         
         print("\n--- Missing Values ---")
-        missing = self.df.isnull().sum()
         if missing.sum() > 0:
             print(missing[missing > 0].to_string())
         else:
@@ -87,6 +467,12 @@ class DataAnalyzer:
     
     def show_statistics(self):
         """Display statistical summary"""
+        if self._agg is not None:
+            self._show_streamed_statistics()
+            return
+        if self._pldf is not None:
+            self._show_polars_statistics()
+            return
         if self.df is None:
             print("No data loaded.")
             return
@@ -95,22 +481,106 @@ class DataAnalyzer:
         print("STATISTICAL SUMMARY")
         print("=" * 60)
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns
+        numeric_cols = self._numeric()
+        if len(numeric_cols) > 0:
+            print("\n--- Numeric Columns ---")
+            # One float64 copy of the numeric columns serves both the summary and the quartiles
+            block = self._numeric_block()
+            summary = self._prescan(block)
+            with warnings.catch_warnings():
+                # All-NaN columns just report NaN quartiles, as describe() does
+                warnings.simplefilter('ignore', RuntimeWarning)
+                quartiles = np.nanquantile(block, [0.25, 0.5, 0.75], axis=0)
+            table = pd.DataFrame({
+                'count': summary['count'],
+                'mean': summary['mean'],
+                'std': summary['std'],
+                'min': summary['min'],
+                '25%': quartiles[0],
+                '50%': quartiles[1],
+                '75%': quartiles[2],
+                'max': summary['max'],
+            }).T
+            print(table.to_string())
+        
+        categorical_idx = self._categorical_idx()
+        if len(categorical_idx) > 0:
+            print("\n--- Categorical Columns ---")
+            if len(categorical_idx) > WIDE_CATEGORICAL_COLUMNS:
+                # count/unique/top/freq for every column in one call
+                print(self.df.iloc[:, categorical_idx].describe(include='all').to_string())
+            else:
+                for pos in categorical_idx:
+                    print(f"\n{self.df.columns[pos]}:")
+                    print(self._top_values(self.df.iloc[:, pos]).to_string())
+        print()
+    
+    def _top_values(self, values, k=5):
+        """The k most frequent entries of a Series, like value_counts().head(k)"""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Counted on the integer codes. Ties keep first-occurrence order,
+            # as for strings, rather than the order of the categories.
+            codes = values.cat.codes.to_numpy()
+            codes = codes[codes >= 0]
+            seen = pd.unique(codes)
+            counts = np.bincount(codes, minlength=len(values.cat.categories))[seen]
+            order = np.argsort(-counts, kind='stable')[:k]
+            index = pd.Index(values.cat.categories[seen[order]], name=values.name)
+            return pd.Series(counts[order], index=index, name='count')
+        counts = values.value_counts(sort=False)
+        if len(counts) > TOP_K_CARDINALITY:
+            return counts.nlargest(k)
+        return counts.sort_values(ascending=False, kind='stable').head(k)
+    
+    def _show_streamed_statistics(self):
+        """Statistical summary from the streamed aggregates (no quartiles)"""
+        print("=" * 60)
+        print("STATISTICAL SUMMARY")
+        print("=" * 60)
+        
+        if len(self._agg['numeric_cols']) > 0:
+            print("\n--- Numeric Columns ---")
+            print(self._streamed_summary().to_string())
+        
+        if len(self._agg['value_counts']) > 0:
+            print("\n--- Categorical Columns ---")
+            for col, counts in self._agg['value_counts'].items():
+                print(f"\n{col}:")
+                top = pd.Series(dict(counts.most_common(5)), name='count').rename_axis(col)
+                print(top.to_string())
+        print()
+    
+    def _show_polars_statistics(self):
+        """Statistical summary computed by Polars"""
+        print("=" * 60)
+        print("STATISTICAL SUMMARY")
+        print("=" * 60)
+        
+        schema = self._pldf.schema
+        numeric_cols = [name for name, dtype in schema.items() if dtype.is_numeric()]
         if len(numeric_cols) > 0:
             print("\n--- Numeric Columns ---")
-            print(self.df[numeric_cols].describe().to_string())
+            # Linear interpolation matches pandas' quartiles (Polars defaults to 'nearest')
+            summary = self._pldf.select(numeric_cols).describe(interpolation='linear')
+            print(summary.to_pandas().set_index('statistic').to_string())
         
-        categorical_cols = self.df.select_dtypes(include=['object', 'category', 'str']).columns
+        categorical_cols = [name for name, dtype in schema.items()
+                            if dtype in (pl.String, pl.Categorical)]
         if len(categorical_cols) > 0:
             print("\n--- Categorical Columns ---")
             for col in categorical_cols:
                 print(f"\n{col}:")
-                print(self.df[col].value_counts().head().to_string())
+                top = self._pldf.get_column(col).drop_nulls().value_counts(sort=True).head(5)
+                print(pd.Series(top['count'].to_list(), name='count',
+                                index=pd.Index(top[col].to_list(), name=col)).to_string())
         print()
     
     def clean_data(self):
         """Basic data cleaning operations"""
-        if self.df is None:
+        if self._agg is not None:
+            print(f"Cleaning needs the full dataset; {self.filename} was too large to load.")
+            return
+        if self._pldf is None and self.df is None:
             print("No data loaded.")
             return
         
@@ -118,41 +588,156 @@ class DataAnalyzer:
         print("DATA CLEANING")
         print("=" * 60)
         
+        if self._pldf is not None:
+            initial_rows, final_rows = self._pldf.height, self._clean_polars()
+        else:
+            initial_rows, final_rows = len(self.df), self._clean_pandas()
+        
+        print(f"\nRows before: {initial_rows} | Rows after: {final_rows}")
+        print()
+    
+    def _clean_pandas(self):
+        """Drop duplicates and fill missing values in self.df; returns the new row count"""
         initial_rows = len(self.df)
         
         # Remove duplicates
-        duplicates = self.df.duplicated().sum()
+        keep = self._unique_mask()
+        duplicates = initial_rows - int(keep.sum())
         if duplicates > 0:
-            self.df = self.df.drop_duplicates()
+            # Dropped rows take their missing values with them, so the counts
+            # the scan needed carry over without another isnull() pass
+            missing_counts = (self._missing().to_numpy()
+                              - self.df[~keep].isnull().sum().to_numpy())
+            self.df = self.df[keep]
+            self._missing_counts = pd.Series(missing_counts, index=self.df.columns)
             print(f"✓ Removed {duplicates} duplicate rows")
         else:
             print("✓ No duplicate rows found")
         
         # Handle missing values
-        missing = self.df.isnull().sum().sum()
+        missing_counts = self._missing()
+        missing = missing_counts.sum()
         if missing > 0:
             # Fill numeric columns with median
-            numeric_cols = self.df.select_dtypes(include=['number']).columns
-            for col in numeric_cols:
-                if self.df[col].isnull().sum() > 0:
-                    self.df[col].fillna(self.df[col].median(), inplace=True)
+            # (blocks get positional labels so fillna's per-column alignment
+            # stays unambiguous with duplicate column names)
+            has_missing = missing_counts.to_numpy() > 0
+            numeric_idx = self._numeric_idx()
+            numeric_idx = numeric_idx[has_missing[numeric_idx]]
+            if len(numeric_idx) > 0:
+                block = self.df.iloc[:, numeric_idx].set_axis(range(len(numeric_idx)), axis=1)
+                # Nullable (e.g. Arrow) integer columns would truncate a fractional
+                # median, so fill them as float64 like the default parser yields
+                int_cols = [i for i, dtype in enumerate(block.dtypes)
+                            if pd.api.types.is_integer_dtype(dtype)]
+                if int_cols:
+                    block = block.astype({i: 'float64' for i in int_cols})
+                self.df.isetitem(numeric_idx, block.fillna(block.median(numeric_only=True)))
             
             # Fill categorical with mode
-            categorical_cols = self.df.select_dtypes(include=['object', 'str']).columns
-            for col in categorical_cols:
-                if self.df[col].isnull().sum() > 0:
-                    self.df[col].fillna(self.df[col].mode()[0], inplace=True)
+            categorical_idx = self._categorical_idx()
+            categorical_idx = categorical_idx[has_missing[categorical_idx]]
+            if len(categorical_idx) > 0:
+                block = self.df.iloc[:, categorical_idx].set_axis(range(len(categorical_idx)), axis=1)
+                modes = block.mode()
+                # Entirely empty columns have no mode and are left alone
+                if len(modes) > 0:
+                    self.df.isetitem(categorical_idx, block.fillna(modes.iloc[0]))
             
+            # Filled in place, so the setter didn't see it
+            self._invalidate_cache()
             print(f"✓ Filled {missing} missing values")
         else:
             print("✓ No missing values found")
         
-        final_rows = len(self.df)
-        print(f"\nRows before: {initial_rows} | Rows after: {final_rows}")
-        print()
+        return len(self.df)
+    
+    def _unique_mask(self):
+        """Mask of the rows drop_duplicates() keeps, via an adjacent-row scan when
+        the rows are already sorted"""
+        keep = self._sorted_unique_mask()
+        if keep is None:
+            return ~self.df.duplicated().to_numpy()
+        return keep
+    
+    def _sorted_unique_mask(self):
+        """Mask keeping the first row of each run of equal rows, or None.
+        
+        Only exact when rows are in lexicographic order, so equal rows are
+        adjacent. Returns None when they aren't, or when a column can't be
+        compared as a plain array (strings, or missing values outside categories).
+        """
+        n_rows, n_cols = self.df.shape
+        if n_rows < 2 or n_cols == 0:
+            return None
+        missing = self._missing().to_numpy()
+        # same[i]: row i + 1 equals row i on every column checked so far
+        same = np.ones(n_rows - 1, dtype=bool)
+        for pos in range(n_cols):
+            col = self.df.iloc[:, pos]
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                # Codes are integers, with -1 for missing
+                values = col.cat.codes.to_numpy()
+            elif missing[pos] == 0:
+                if isinstance(col.dtype, pd.ArrowDtype):
+                    # Ask for the matching numpy dtype, otherwise Arrow dates
+                    # (e.g. date32 from the pyarrow CSV engine) come back as objects
+                    target = col.dtype.numpy_dtype
+                    if target.kind not in 'biufmM':
+                        return None
+                    values = col.to_numpy(dtype=target)
+                else:
+                    values = col.to_numpy()
+                if values.dtype.kind not in 'biufmM':
+                    return None
+            else:
+                return None
+            later, earlier = values[1:], values[:-1]
+            if np.any(same & (later < earlier)):
+                return None
+            same &= ~(later > earlier)
+            if not same.any():
+                break
+        return np.concatenate([[True], ~same])
+    
+    def _clean_polars(self):
+        """Same cleaning as _clean_pandas, on the Polars frame"""
+        initial_rows = self._pldf.height
+        cleaned = self._pldf.unique(maintain_order=True)
+        duplicates = initial_rows - cleaned.height
+        if duplicates > 0:
+            print(f"✓ Removed {duplicates} duplicate rows")
+        else:
+            print("✓ No duplicate rows found")
+        
+        null_counts = cleaned.null_count().row(0)
+        missing = sum(null_counts)
+        if missing > 0:
+            # Median for numeric columns, (smallest) mode for strings, as pandas does
+            fills = []
+            for (name, dtype), nulls in zip(cleaned.schema.items(), null_counts):
+                if nulls == 0:
+                    continue
+                col = pl.col(name)
+                if dtype.is_numeric():
+                    # Same linear-interpolated median show_statistics reports
+                    fills.append(col.fill_null(col.quantile(0.5, interpolation='linear')))
+                elif dtype in (pl.String, pl.Categorical):
+                    fills.append(col.fill_null(col.drop_nulls().mode().sort().first()))
+            cleaned = cleaned.with_columns(fills)
+            print(f"✓ Filled {missing} missing values")
+        else:
+            print("✓ No missing values found")
+        
+        self.df = None
+        self._pldf = cleaned
+        return cleaned.height
     
     def create_visualizations(self):
         """Generate common data visualizations"""
+        if self._agg is not None:
+            print(f"Visualizations need the full dataset; {self.filename} was too large to load.")
+            return
         if self.df is None:
             print("No data loaded.")
             return
@@ -161,63 +746,104 @@ class DataAnalyzer:
         print("CREATING VISUALIZATIONS")
         print("=" * 60)
         
-        numeric_cols = self.df.select_dtypes(include=['number']).columns.tolist()
-        categorical_cols = self.df.select_dtypes(include=['object', 'category', 'str']).columns.tolist()
+        numeric_idx = self._numeric_idx()
+        categorical_idx = self._categorical_idx()
+        numeric_cols = self.df.columns[numeric_idx].tolist()
+        categorical_cols = self.df.columns[categorical_idx].tolist()
         
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle(f'Data Analysis Dashboard: {self.filename}', fontsize=16, fontweight='bold')
+        # Panels are prepared here as plain arrays, then drawn by _render_panel
+        panels = []
         
         # Plot 1: Distribution of first numeric column
         if len(numeric_cols) > 0:
-            axes[0, 0].hist(self.df[numeric_cols[0]].dropna(), bins=30, color='skyblue', edgecolor='black')
-            axes[0, 0].set_title(f'Distribution of {numeric_cols[0]}')
-            axes[0, 0].set_xlabel(numeric_cols[0])
-            axes[0, 0].set_ylabel('Frequency')
+            values = self.df.iloc[:, numeric_idx[0]].dropna().to_numpy(copy=False)
+            counts, edges = np.histogram(values, bins=30)
+            panels.append(('hist', {'counts': counts, 'edges': edges, 'column': numeric_cols[0]}))
+        else:
+            panels.append((None, {}))
         
         # Plot 2: Bar chart of first categorical column
         if len(categorical_cols) > 0:
-            value_counts = self.df[categorical_cols[0]].value_counts().head(10)
-            axes[0, 1].bar(range(len(value_counts)), value_counts.values, color='coral')
-            axes[0, 1].set_title(f'Top Values in {categorical_cols[0]}')
-            axes[0, 1].set_xticks(range(len(value_counts)))
-            axes[0, 1].set_xticklabels(value_counts.index, rotation=45, ha='right')
-            axes[0, 1].set_ylabel('Count')
+            value_counts = self.df.iloc[:, categorical_idx[0]].value_counts().head(10)
+            panels.append(('bar', {
+                'counts': value_counts.to_numpy(),
+                'labels': [str(label) for label in value_counts.index],
+                'column': categorical_cols[0],
+            }))
+        else:
+            panels.append((None, {}))
         
         # Plot 3: Correlation heatmap
         if len(numeric_cols) >= 2:
-            corr_matrix = self.df[numeric_cols].corr()
-            sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', 
-                       ax=axes[1, 0], cbar_kws={'label': 'Correlation'})
-            axes[1, 0].set_title('Correlation Heatmap')
+            block = self.df.iloc[:, numeric_idx].to_numpy(dtype=np.float32, na_value=np.nan)
+            with warnings.catch_warnings():
+                # All-NaN or constant columns yield NaN entries, as DataFrame.corr() does
+                warnings.simplefilter('ignore', RuntimeWarning)
+                block = np.where(np.isnan(block), np.nanmedian(block, axis=0), block)
+                corr = np.corrcoef(block, rowvar=False, dtype=np.float32)
+            panels.append(('heatmap', {'corr': corr, 'labels': [str(col) for col in numeric_cols]}))
+        else:
+            panels.append((None, {}))
         
         # Plot 4: Scatter plot or box plot
         if len(numeric_cols) >= 2:
-            axes[1, 1].scatter(self.df[numeric_cols[0]], self.df[numeric_cols[1]], 
-                             alpha=0.5, color='green')
-            axes[1, 1].set_title(f'{numeric_cols[0]} vs {numeric_cols[1]}')
-            axes[1, 1].set_xlabel(numeric_cols[0])
-            axes[1, 1].set_ylabel(numeric_cols[1])
+            x = self.df.iloc[:, numeric_idx[0]].to_numpy(dtype=np.float64, na_value=np.nan)
+            y = self.df.iloc[:, numeric_idx[1]].to_numpy(dtype=np.float64, na_value=np.nan)
+            n = len(x)
+            if n > HEXBIN_THRESHOLD:
+                # Aggregate on a grid instead of drawing one marker per row
+                valid = ~(np.isnan(x) | np.isnan(y))
+                kind, x, y = 'hexbin', x[valid], y[valid]
+            else:
+                if n > MAX_SCATTER_POINTS:
+                    idx = np.random.default_rng(0).choice(n, size=MAX_SCATTER_POINTS, replace=False)
+                    x, y = x[idx], y[idx]
+                kind = 'scatter'
+            panels.append((kind, {'x': x, 'y': y, 'xlabel': numeric_cols[0], 'ylabel': numeric_cols[1]}))
+        else:
+            panels.append((None, {}))
         
-        plt.tight_layout()
+        # Panel inputs are already binned/subsampled, so drawing them is cheap
+        # and stays in-process (worker processes would cost more to start)
+        images = [_render_panel(kind, payload) for kind, payload in panels]
+        
+        dashboard = np.vstack([
+            _render_title(f'Data Analysis Dashboard: {self.filename}'),
+            np.hstack(images[:2]),
+            np.hstack(images[2:]),
+        ])
         
         # Save figure with timestamp (cross-platform path)
+        plt, _ = _pyplot()
         timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
         output_file = f'analysis_dashboard_{timestamp}.png'
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        plt.imsave(output_file, dashboard, dpi=DASHBOARD_DPI)
         print(f"✓ Dashboard saved to: {output_file}")
-        plt.close()
         print()
     
     def export_report(self):
         """Export analysis report to text file"""
-        if self.df is None:
+        if self._agg is not None:
+            rows, dtypes = self._agg['rows'], self._agg['dtypes']
+            summary, head = self._streamed_summary(), self._agg['head']
+        elif self.df is None:
             print("No data loaded.")
             return
+        else:
+            rows, dtypes = self.df.shape[0], self.df.dtypes
+            # Numeric columns only, like show_statistics; parsed dates would
+            # otherwise add a column and reorder the describe() rows
+            numeric_idx = self._numeric_idx()
+            described = self.df.iloc[:, numeric_idx] if len(numeric_idx) > 0 else self.df
+            summary, head = described.describe(), self.df.head()
         
         timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')
         report_file = f'analysis_report_{timestamp}.txt'
         
-        with open(report_file, 'w') as f:
+        fd = os.open(report_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        raw = io.BufferedWriter(io.FileIO(fd, 'w'), buffer_size=REPORT_BUFFER_SIZE)
+        # write_through hands encoded text straight to the 1 MiB buffer
+        with io.TextIOWrapper(raw, encoding='utf-8', write_through=True) as f:
             f.write("=" * 60 + "\n")
             f.write("DATA ANALYSIS REPORT\n")
             f.write("=" * 60 + "\n\n")
@@ -226,17 +852,21 @@ class DataAnalyzer:
             f.write(f"Generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
             f.write("--- DATASET OVERVIEW ---\n")
-            f.write(f"Rows: {self.df.shape[0]}\n")
-            f.write(f"Columns: {self.df.shape[1]}\n\n")
+            f.write(f"Rows: {rows}\n")
+            f.write(f"Columns: {len(dtypes)}\n\n")
             
             f.write("--- COLUMN TYPES ---\n")
-            f.write(self.df.dtypes.to_string() + "\n\n")
+            # Let pandas write straight into the file instead of building one big string
+            dtypes.to_string(buf=f)
+            f.write("\n\n")
             
             f.write("--- STATISTICAL SUMMARY ---\n")
-            f.write(self.df.describe().to_string() + "\n\n")
+            summary.to_string(buf=f)
+            f.write("\n\n")
             
             f.write("--- TOP 5 ROWS ---\n")
-            f.write(self.df.head().to_string() + "\n\n")
+            head.to_string(buf=f)
+            f.write("\n\n")
         
         print(f"✓ Report exported to: {report_file}\n")
 